@@ -1,7 +1,13 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
+from flask.json.provider import JSONProvider
+from functools import lru_cache
 import math
+import threading
 import numpy as np
+import orjson
+from numba import njit
 from scipy.optimize import linprog
+from scipy.sparse import csc_matrix
 
 """
 Flask backend for the viscosity web application.
@@ -15,9 +21,10 @@ Endpoints:
   /            : Serves the main single‑page application.
   /api/viscosity_temperature (POST)
                  Given two reference viscosities and temperatures, returns
-                 Walther correlation parameters (slope and intercept), a
-                 viscosity at a desired temperature, and a table of
-                 viscosity values between ‑20 °C and 100 °C.
+                 Walther correlation parameters (slope and intercept), the
+                 viscosity at one or a list of desired temperatures, and a
+                 table of viscosity values between ‑20 °C and 100 °C
+                 (parallel 'temps' and 'viscs' lists).
   /api/vi (POST)
                  Computes the kinematic viscosity index (VI) using the
                  ASTM D2270 method.  The service first determines the
@@ -52,9 +59,124 @@ is used.  The inverse transform is
 See the workbook viscobat.xlsx for the origin of these formulas.
 """
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider delegating to orjson for request parsing and jsonify.
+
+    Integer keys (solver fractions) and NumPy values are serialised
+    natively; NaN and infinities are emitted as null.
+    """
+
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj, default=None, sort_keys=False, **kwargs):
+        # only the json.dumps arguments orjson can honour are accepted
+        if kwargs:
+            raise TypeError(f'Unsupported dumps() arguments: {", ".join(kwargs)}')
+        option = self.option | orjson.OPT_SORT_KEYS if sort_keys else self.option
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            raise TypeError(f'Unsupported loads() arguments: {", ".join(kwargs)}')
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # same argument handling as jsonify: a single value, several values
+        # as a list, or keyword arguments as a dict
+        if args and kwargs:
+            raise TypeError('response() takes either args or kwargs, not both')
+        if kwargs:
+            obj = kwargs
+        elif len(args) == 1:
+            obj = args[0]
+        else:
+            obj = list(args) or None
+        # hand the encoded bytes straight to the response, skipping str
+        return self._app.response_class(orjson.dumps(obj, option=self.option),
+                                        mimetype='application/json')
+
+
 app = Flask(__name__, static_folder='static', template_folder='templates')
+app.json = OrjsonProvider(app)
+
+# temperatures (°C) of the viscosity table, -20 °C to 100 °C every 10 °C
+_TABLE_TEMPS = np.arange(-20, 101, 10, dtype=np.float64)
+_TABLE_TEMPS_LIST = [int(T) for T in _TABLE_TEMPS]
+
+# HiGHS options for the mixture LPs: the problems have a handful of
+# variables and at most three constraints, so presolve costs more than it saves
+_LP_OPTIONS = {'presolve': False, 'disp': False}
+
+# ln(10), used to evaluate powers of ten with exp
+_LN10 = math.log(10.0)
+
+
+def _walther_x(v: float) -> float:
+    """Return the Walther transform x = log10(log10(v + 0.7)).
+
+    Raises ValueError for v <= 0.3, outside the transform's domain.
+    """
+    return math.log10(math.log10(v + 0.7))
+
+
+@njit(cache=True)
+def _walther_x_nb(v: float) -> float:
+    """Compiled Walther transform for Numba kernels; NaN for v <= 0.3."""
+    return math.log10(math.log10(v + 0.7))
+
+
+def _inv_walther(x: float) -> float:
+    """Return the viscosity v = 10**(10**x) - 0.7 for a Walther x value."""
+    return math.exp(math.exp(x * _LN10) * _LN10) - 0.7
+
+
+def _walther_x_array(v, out=None):
+    """Vectorised Walther transform of an array of viscosities.
+
+    Returns None if any viscosity is <= 0.3, outside the transform's domain.
+    """
+    x = np.add(v, 0.7, out=out)
+    if (x <= 1.0).any():
+        return None
+    np.log10(x, out=x)
+    return np.log10(x, out=x)
+
+
+# compiled twin of _inv_walther for the Numba kernels; Python callers use the
+# plain function, which avoids the dispatcher overhead on scalar calls
+_inv_walther_nb = njit(cache=True)(_inv_walther)
+
 
+# per-thread scratch arrays reused across requests
+class _Scratch(threading.local):
+    """Per-thread LP arrays for solve_general_mixture.
 
+    The arrays are rebuilt only when the number of variables m changes, so
+    repeated solves of the same size reuse them; callers must not keep them
+    past the request.  The constraint matrices are kept as views indexed by
+    row count (0, 1 or 2 rows) so no slicing happens per call.
+    """
+    m = -1
+
+    def resize(self, m: int):
+        self.m = m
+        self.x_values = np.empty(m)
+        self.c = np.empty(m)
+        self.lb = np.empty(m)
+        self.ub = np.empty(m)
+        A_eq, b_eq = np.empty((2, m)), np.empty(2)
+        A_ub, b_ub = np.empty((2, m)), np.empty(2)
+        self.A_eq = [A_eq[:k] for k in range(3)]
+        self.b_eq = [b_eq[:k] for k in range(3)]
+        self.A_ub = [A_ub[:k] for k in range(3)]
+        self.b_ub = [b_ub[:k] for k in range(3)]
+
+
+_scratch = _Scratch()
+
+
+@njit(cache=True)
 def walther_params(v1: float, t1: float, v2: float, t2: float):
     """Return slope and intercept of the Walther correlation.
 
@@ -80,8 +202,8 @@ def walther_params(v1: float, t1: float, v2: float, t2: float):
     t1 = float(t1)
     t2 = float(t2)
     # compute log coordinates
-    x1 = math.log10(math.log10(v1 + 0.7))
-    x2 = math.log10(math.log10(v2 + 0.7))
+    x1 = _walther_x_nb(v1)
+    x2 = _walther_x_nb(v2)
     y1 = math.log10(t1 + 273.15)
     y2 = math.log10(t2 + 273.15)
     # avoid division by zero if temperatures coincide
@@ -93,81 +215,130 @@ def walther_params(v1: float, t1: float, v2: float, t2: float):
     return slope, intercept
 
 
+# compile the Walther fit at import; it sits on every temperature and VI request
+walther_params(100.0, 40.0, 10.0, 100.0)
+
+
+@njit(cache=True)
 def walther_viscosity_at_temp(slope: float, intercept: float, temp_c: float):
     """Compute viscosity (mm²/s) at a given temperature using Walther parameters."""
     x = intercept - slope * math.log10(temp_c + 273.15)
-    return 10 ** (10 ** x) - 0.7
+    return _inv_walther_nb(x)
 
 
-def compute_vi_from_v40_v100(u: float, y: float) -> float:
-    """Compute the viscosity index given viscosities at 40 °C and 100 °C.
+@njit(cache=True)
+def _fill_viscosities(slope: float, intercept: float, temps: np.ndarray, visc_out: np.ndarray):
+    """Fill visc_out with the Walther viscosities at temps (°C)."""
+    for i in range(temps.shape[0]):
+        visc_out[i] = walther_viscosity_at_temp(slope, intercept, temps[i])
 
-    Implements the piecewise formulas found in the Excel workbook (sheet ‘VI’).
-    See comments in the workbook for derivation.  Returns a value rounded to
-    one decimal place.
+
+def walther_viscosities_at_temps(slope: float, intercept: float, temps_c: np.ndarray) -> np.ndarray:
+    """Vectorised walther_viscosity_at_temp over an array of temperatures (°C)."""
+    temps = np.ascontiguousarray(temps_c, dtype=np.float64).ravel()
+    viscs = np.empty_like(temps)
+    _fill_viscosities(slope, intercept, temps, viscs)
+    return viscs.reshape(np.shape(temps_c))
+
+
+@njit(cache=True)
+def _compute_table(v1: float, t1: float, v2: float, t2: float,
+                   temps: np.ndarray, visc_out: np.ndarray):
+    """Fit the Walther line and fill visc_out with viscosities at temps (°C).
+
+    Fuses walther_params and the table evaluation in one compiled call.
+
+    Returns:
+        (slope, intercept)
     """
+    slope, intercept = walther_params(v1, t1, v2, t2)
+    _fill_viscosities(slope, intercept, temps, visc_out)
+    return slope, intercept
+
+
+# compile the table kernel and the helpers called directly from Python at import
+_compute_table(100.0, 40.0, 10.0, 100.0, _TABLE_TEMPS, np.empty_like(_TABLE_TEMPS))
+walther_viscosity_at_temp(3.5, 9.0, 40.0)
+
+
+@njit(cache=True)
+def _vi_piece(a: float, b: float, U: float, lnY: float) -> float:
+    """Compute VI for a given pair of functions a(Y) and b(Y); lnY = ln(Y)."""
+    # eqn for c (AB6 etc)
+    c = (100 * (a + b - U)) / b
+    # eqn for d (AB7 etc)
+    # avoid log of negative numbers
+    if a <= 0 or U <= 0:
+        return math.nan
+    d = (math.log(a) - math.log(U)) / lnY
+    e = ((10 ** d - 1) / 0.00715) + 100
+    # if c > 100 use e, else use c
+    return e if c > 100 else c
+
+
+@njit(cache=True)
+def _vi_kernel(u: float, y: float) -> float:
+    """Unrounded viscosity index; see compute_vi_from_v40_v100."""
     U = float(u)
     Y = float(y)
     # guard against invalid inputs
     if U <= 0 or Y <= 0:
-        return float('nan')
+        return math.nan
     # low viscosity regime
     if Y < 2:
         # low viscosity method (AJ formulas)
-        logU = math.log10(math.log10(U + 0.7))
-        logY = math.log10(math.log10(Y + 0.7))
-        AJ5 = 10 ** (10 ** (logU + ((logU - logY) * 0.04022))) - 0.7
-        AJ6 = 10 ** (10 ** (logU + ((logU - logY) * 0.98316))) - 0.7
+        logU = _walther_x_nb(U)
+        logY = _walther_x_nb(Y)
+        AJ5 = _inv_walther_nb(logU + ((logU - logY) * 0.04022))
+        AJ6 = _inv_walther_nb(logU + ((logU - logY) * 0.98316))
         numerator = 1.2665 * (AJ6 ** 2) + 1.655 * AJ6 - AJ5
         denominator = 0.34984 * (AJ6 ** 2) + 0.1725 * AJ6
         if denominator == 0:
-            return float('nan')
-        vi = 100 * numerator / denominator
-        return round(vi, 1)
-    # piecewise regimes according to Y
-    def compute_piece(a_coef, b_coef):
-        """Helper to compute VI for a given pair of functions a(Y) and b(Y)."""
-        a = a_coef
-        b = b_coef
-        # eqn for c (AB6 etc)
-        c = (100 * (a + b - U)) / b
-        # eqn for d (AB7 etc)
-        # avoid log of negative numbers
-        if a <= 0 or U <= 0 or Y <= 0:
-            return float('nan')
-        d = (math.log(a) - math.log(U)) / math.log(Y)
-        e = ((10 ** d - 1) / 0.00715) + 100
-        # if c > 100 use e, else use c
-        f = e if c > 100 else c
-        return round(f, 1)
+            return math.nan
+        return 100 * numerator / denominator
+    # powers of Y shared by the piecewise functions below
+    Y2 = Y * Y
+    sqrtY = math.sqrt(Y)
+    lnY = math.log(Y)
     # compute piecewise functions for a(Y), b(Y) depending on Y
     # definitions from workbook
     if Y < 4:
-        a = 0.827 * (Y ** 2) + 1.632 * Y - 0.181
-        b = 0.3094 * (Y ** 2) + 0.182 * Y
-        return compute_piece(a, b)
+        a = 0.827 * Y2 + 1.632 * Y - 0.181
+        b = 0.3094 * Y2 + 0.182 * Y
     elif Y < 6.1:
-        a = -2.6758 * (Y ** 2) + 96.671 * Y - 269.664 * (Y ** 0.5) + 215.025
-        b = -7.1955 * (Y ** 2) + 241.992 * Y - 725.478 * (Y ** 0.5) + 603.888
-        return compute_piece(a, b)
+        a = -2.6758 * Y2 + 96.671 * Y - 269.664 * sqrtY + 215.025
+        b = -7.1955 * Y2 + 241.992 * Y - 725.478 * sqrtY + 603.888
     elif Y < 7.2:
-        a = 2.32 * (Y ** 1.5626)
-        b = 2.838 * (Y ** 2) - 27.35 * Y + 81.83
-        return compute_piece(a, b)
+        a = 2.32 * math.pow(Y, 1.5626)
+        b = 2.838 * Y2 - 27.35 * Y + 81.83
     elif Y < 12.4:
-        a = 0.1922 * (Y ** 2) + 8.25 * Y - 18.728
-        b = 0.5463 * (Y ** 2) + 2.442 * Y - 14.16
-        return compute_piece(a, b)
+        a = 0.1922 * Y2 + 8.25 * Y - 18.728
+        b = 0.5463 * Y2 + 2.442 * Y - 14.16
     elif Y < 70:
-        a = 1795.2 * (Y ** -2) + 0.1818 * (Y ** 2) + 10.357 * Y - 54.547
-        b = 0.6995 * (Y ** 2) - 1.19 * Y + 7.6
-        return compute_piece(a, b)
+        a = 1795.2 / Y2 + 0.1818 * Y2 + 10.357 * Y - 54.547
+        b = 0.6995 * Y2 - 1.19 * Y + 7.6
     else:
         # Y >= 70
-        a0 = 0.835313 * (Y ** 2) + 14.6731 * Y - 216.246
-        b = 0.666904 * (Y ** 2) + 2.8238 * Y - 119.298
+        a0 = 0.835313 * Y2 + 14.6731 * Y - 216.246
+        b = 0.666904 * Y2 + 2.8238 * Y - 119.298
         a = a0 - b
-        return compute_piece(a, b)
+    return _vi_piece(a, b, U, lnY)
+
+
+# compile the VI kernel at import so the first request does not pay for it
+_vi_kernel(50.0, 8.0)
+
+
+def compute_vi_from_v40_v100(u: float, y: float) -> float:
+    """Compute the viscosity index given viscosities at 40 °C and 100 °C.
+
+    Implements the piecewise formulas found in the Excel workbook (sheet ‘VI’).
+    See comments in the workbook for derivation.  Returns a value rounded to
+    one decimal place.  The arithmetic runs in the compiled _vi_kernel; the
+    rounding stays in Python, whose round() is correctly rounded where
+    Numba's is not (95.35 -> 95.3 here, 95.4 under Numba).
+    """
+    return round(_vi_kernel(float(u), float(y)), 1)
 
 
 def compute_mixture(viscosities: list, fractions: list) -> float:
@@ -183,26 +354,34 @@ def compute_mixture(viscosities: list, fractions: list) -> float:
     """
     if not viscosities or not fractions or len(viscosities) != len(fractions):
         return float('nan')
-    # convert to Walther x values
-    x_values = []
-    for v in viscosities:
-        v = float(v)
-        # guard against non‑positive viscosity
-        if v <= 0:
-            return float('nan')
-        x_values.append(math.log10(math.log10(v + 0.7)))
-    # compute weighted average of x values
+    # weighted average of the Walther x values; a viscosity outside the
+    # transform's domain (v <= 0.3) makes the mixture undefined
     x_mix = 0.0
-    for w, x in zip(fractions, x_values):
-        x_mix += w * x
+    for v, w in zip(viscosities, fractions):
+        try:
+            x_mix += w * _walther_x(float(v))
+        except ValueError:
+            return float('nan')
     # invert Walther transform
-    return 10 ** (10 ** x_mix) - 0.7
+    return _inv_walther(x_mix)
+
+
+# rendered bytes of the single page application, filled on first request
+_INDEX_HTML = None
 
 
 @app.route('/')
 def serve_index():
-    """Serve the single page application."""
-    return render_template('index.html')
+    """Serve the single page application.
+
+    The page only uses url_for for static assets, so it is rendered once
+    (inside a request, where the script root is known) and the bytes are
+    reused for every later request.
+    """
+    global _INDEX_HTML
+    if _INDEX_HTML is None:
+        _INDEX_HTML = render_template('index.html').encode('utf-8')
+    return Response(_INDEX_HTML, mimetype='text/html')
 
 
 @app.route('/api/viscosity_temperature', methods=['POST'])
@@ -215,27 +394,31 @@ def api_viscosity_temperature():
         t2 = float(data.get('t2', 0))
     except (TypeError, ValueError):
         return jsonify({'error': 'Invalid input'}), 400
-    # compute Walther parameters
-    slope, intercept = walther_params(v1, t1, v2, t2)
-    # compute table from -20 to 100 °C inclusive every 10 °C
-    temps = list(range(-20, 101, 10))
-    table = []
-    for T in temps:
-        visc = walther_viscosity_at_temp(slope, intercept, T)
-        table.append({'temperature': T, 'viscosity': visc})
-    # compute optional target viscosity
+    # compute Walther parameters and the table from -20 to 100 °C inclusive
+    # every 10 °C in one compiled call
+    viscs = np.empty_like(_TABLE_TEMPS)
+    slope, intercept = _compute_table(v1, t1, v2, t2, _TABLE_TEMPS, viscs)
+    if not (math.isfinite(slope) and math.isfinite(intercept)):
+        # viscosities outside the Walther domain (v <= 0.3) give a NaN fit
+        return jsonify({'error': 'Invalid input'}), 400
+    # the table is sent as two parallel lists rather than one dict per row
     result = {
         'slope': slope,
         'intercept': intercept,
-        'table': table
+        'temps': _TABLE_TEMPS_LIST,
+        'viscs': np.round(viscs, 4).tolist()
     }
-    if 'target' in data:
+    # compute optional target viscosity; the target may be a single
+    # temperature or a list of them, answered in the same shape
+    if data.get('target') is not None:
         try:
-            target_temp = float(data['target'])
-            visc_target = walther_viscosity_at_temp(slope, intercept, target_temp)
-            result['targetViscosity'] = visc_target
+            targets = np.asarray(data['target'], dtype=np.float64)
         except (TypeError, ValueError):
-            pass
+            return jsonify({'error': 'Invalid target'}), 400
+        if targets.ndim > 1:
+            return jsonify({'error': 'Invalid target'}), 400
+        visc_target = walther_viscosities_at_temps(slope, intercept, targets)
+        result['targetViscosity'] = visc_target.tolist()
     return jsonify(result)
 
 
@@ -251,8 +434,11 @@ def api_vi():
         return jsonify({'error': 'Invalid input'}), 400
     # compute Walther parameters and viscosities at 40 and 100 °C
     slope, intercept = walther_params(v1, t1, v2, t2)
-    v40 = walther_viscosity_at_temp(slope, intercept, 40)
-    v100 = walther_viscosity_at_temp(slope, intercept, 100)
+    if not (math.isfinite(slope) and math.isfinite(intercept)):
+        # viscosities outside the Walther domain (v <= 0.3) give a NaN fit
+        return jsonify({'error': 'Invalid input'}), 400
+    v40 = walther_viscosity_at_temp(slope, intercept, 40.0)
+    v100 = walther_viscosity_at_temp(slope, intercept, 100.0)
     vi = compute_vi_from_v40_v100(v40, v100)
     return jsonify({'v40': v40, 'v100': v100, 'vi': vi})
 
@@ -282,6 +468,8 @@ def api_mixture():
     # convert percentages to fractions
     fractions = [p / 100.0 for p in percents]
     mixture_visc = compute_mixture(viscosities, fractions)
+    if not math.isfinite(mixture_visc):
+        return jsonify({'error': 'Viscosities are too low for the Walther transform'}), 400
     return jsonify({'viscosity': mixture_visc})
 
 
@@ -296,8 +484,6 @@ def api_mix2():
         return jsonify({'error': 'Invalid input'}), 400
     # known components may exist
     known_comps = data.get('knownComponents', [])
-    viscosities = []
-    percents = []
     sum_known = 0.0
     x_known_sum = 0.0
     for comp in known_comps:
@@ -308,19 +494,25 @@ def api_mix2():
             return jsonify({'error': 'Invalid component data'}), 400
         if p < 0:
             return jsonify({'error': 'Percentages must be non‑negative'}), 400
-        sum_known += p / 100.0
-        # compute x contributions for known components
         if v <= 0:
             return jsonify({'error': 'Viscosities must be positive'}), 400
-        x_known_sum += (p / 100.0) * math.log10(math.log10(v + 0.7))
+        # compute fraction and x contribution of the known component
+        try:
+            x_known_sum += (p / 100.0) * _walther_x(v)
+        except ValueError:
+            return jsonify({'error': 'Viscosities are too low for the Walther transform'}), 400
+        sum_known += p / 100.0
     if sum_known >= 1:
         return jsonify({'error': 'Sum of known percentages must be less than 100'}), 400
     # convert target and bases to x domain
     if target <= 0 or baseA <= 0 or baseB <= 0:
         return jsonify({'error': 'Viscosities must be positive'}), 400
-    x_target = math.log10(math.log10(target + 0.7))
-    x_A = math.log10(math.log10(baseA + 0.7))
-    x_B = math.log10(math.log10(baseB + 0.7))
+    try:
+        x_target = _walther_x(target)
+        x_A = _walther_x(baseA)
+        x_B = _walther_x(baseB)
+    except ValueError:
+        return jsonify({'error': 'Viscosities are too low for the Walther transform'}), 400
     p_remaining = 1.0 - sum_known
     # compute p_A fraction
     denominator = (x_A - x_B)
@@ -346,6 +538,143 @@ def api_mix2():
     return jsonify({'percentA': p_A_percent, 'percentB': p_B_percent})
 
 
+@njit(cache=True)
+def _simplex_solve(c, A_eq, b_eq, A_ub, b_ub, lb, ub):
+    """Minimise c @ x subject to A_eq @ x = b_eq, A_ub @ x <= b_ub, lb <= x <= ub.
+
+    Dense Big-M tableau simplex with Bland's pivoting rule, intended for the
+    tiny LPs built by solve_general_mixture where scipy's linprog spends far
+    more time in Python overhead than in the actual solve.  The variables are
+    shifted to y = x - lb; every finite upper bound becomes an extra
+    inequality row.
+
+    Returns:
+        (x, status) where status is 0 when an optimum was found, 1 when an
+        artificial variable stays positive (infeasible or numerically
+        doubtful), 2 when the problem is unbounded and 3 when the iteration
+        limit was reached.
+    """
+    big_m = 1e6
+    tol = 1e-9
+    m = c.shape[0]
+    n_eq = A_eq.shape[0]
+    n_ub = A_ub.shape[0]
+    n_bnd = 0
+    for j in range(m):
+        if np.isfinite(ub[j]):
+            n_bnd += 1
+    n_slack = n_ub + n_bnd
+    rows = n_eq + n_slack
+    # columns: shifted variables, slacks, one artificial per row, rhs
+    n_col = m + n_slack + rows
+    T = np.zeros((rows + 1, n_col + 1))
+    cost = np.zeros(n_col)
+    basis = np.empty(rows, dtype=np.int64)
+    for i in range(n_eq):
+        rhs = b_eq[i]
+        for j in range(m):
+            T[i, j] = A_eq[i, j]
+            rhs -= A_eq[i, j] * lb[j]
+        T[i, n_col] = rhs
+    for k in range(n_ub):
+        i = n_eq + k
+        rhs = b_ub[k]
+        for j in range(m):
+            T[i, j] = A_ub[k, j]
+            rhs -= A_ub[k, j] * lb[j]
+        T[i, m + k] = 1.0
+        T[i, n_col] = rhs
+    k = n_ub
+    for j in range(m):
+        if np.isfinite(ub[j]):
+            i = n_eq + k
+            T[i, j] = 1.0
+            T[i, m + k] = 1.0
+            T[i, n_col] = ub[j] - lb[j]
+            k += 1
+    for j in range(m):
+        cost[j] = c[j]
+    # initial basis: the slack where it is feasible, otherwise an artificial
+    for i in range(rows):
+        if T[i, n_col] < 0:
+            T[i, :] = -T[i, :]
+        if i >= n_eq and T[i, m + i - n_eq] > 0:
+            basis[i] = m + i - n_eq
+        else:
+            a = m + n_slack + i
+            T[i, a] = 1.0
+            cost[a] = big_m
+            basis[i] = a
+    # reduced costs in the last row
+    T[rows, :n_col] = cost
+    for i in range(rows):
+        cb = cost[basis[i]]
+        if cb != 0.0:
+            T[rows, :] -= cb * T[i, :]
+    status = 3
+    for _ in range(50 * (rows + n_col)):
+        # Bland's rule: lowest index with a negative reduced cost enters
+        enter = -1
+        for j in range(n_col):
+            if T[rows, j] < -tol:
+                enter = j
+                break
+        if enter < 0:
+            status = 0
+            break
+        # minimum ratio test, ties broken by lowest basic index
+        leave = -1
+        best = np.inf
+        for i in range(rows):
+            a = T[i, enter]
+            if a > tol:
+                ratio = T[i, n_col] / a
+                if ratio < best - tol or (ratio <= best + tol and leave >= 0
+                                          and basis[i] < basis[leave]):
+                    best = ratio
+                    leave = i
+        if leave < 0:
+            status = 2
+            break
+        T[leave, :] /= T[leave, enter]
+        for i in range(rows + 1):
+            f = T[i, enter]
+            if i != leave and f != 0.0:
+                T[i, :] -= f * T[leave, :]
+        basis[leave] = enter
+    x = lb.copy()
+    for i in range(rows):
+        b = basis[i]
+        if b < m:
+            x[b] += T[i, n_col]
+        elif status == 0 and b >= m + n_slack and T[i, n_col] > 1e-7:
+            status = 1
+    return x, status
+
+
+# compile the simplex at import so the first solver request does not pay for it
+_simplex_solve(np.zeros(2), np.ones((1, 2)), np.ones(1), np.ones((1, 2)),
+               np.ones(1), np.zeros(2), np.ones(2))
+
+
+@lru_cache(maxsize=1024)
+def _fixed_summary(fixed: tuple):
+    """Return (fixed_sum, fixed_x_contrib) for the fixed solver components.
+
+    Args:
+        fixed: tuple of (viscosity, fraction) pairs
+
+    Returns None if a viscosity is outside the Walther domain.  Memoised because a UI session typically re-solves with the same fixed
+    components, so their Walther transforms are only computed once.
+    """
+    viscs = np.array([v for v, _ in fixed], dtype=np.float64)
+    fractions = np.array([p for _, p in fixed], dtype=np.float64)
+    x_fixed = _walther_x_array(viscs)
+    if x_fixed is None:
+        return None
+    return float(fractions.sum()), float(fractions @ x_fixed)
+
+
 def solve_general_mixture(data):
     """Solve a general mixture design problem using linear programming.
 
@@ -376,20 +705,20 @@ def solve_general_mixture(data):
     objective_type = None  # 'mixture' or 'component'
     objective_index = None
     objective_direction = None  # 'min' or 'max'
-    # parse components for objective flags and bounds
-    fixed_fractions = []
-    fixed_x_contrib = 0.0
-    fixed_sum = 0.0
-    var_bounds = []  # for variables (non‑fixed)
-    x_values = []  # x values for variables (non‑fixed)
-    var_indices = []  # original index of each variable in comps
+    # parse components into parallel arrays (validating each one) and
+    # record objective flags
+    is_fixed = np.zeros(n, dtype=bool)
+    viscs = np.empty(n)
+    values = np.zeros(n)  # fraction of fixed components
+    mins = np.zeros(n)  # lower bound of variable components
+    maxs = np.ones(n)  # upper bound of variable components
+    n_var = 0
     for idx, comp in enumerate(comps):
         ctype = comp.get('type', 'free')
         visc = comp.get('viscosity')
         if visc is None or visc <= 0:
             return {'error': f'Component {idx+1} viscosity must be positive'}
-        # convert viscosity to x domain
-        x_i = math.log10(math.log10(float(visc) + 0.7))
+        viscs[idx] = visc
         if ctype == 'fixed' or ctype == 'setValue':
             # fraction is fixed
             val = comp.get('value')
@@ -401,43 +730,48 @@ def solve_general_mixture(data):
                 return {'error': f'Component {idx+1} fixed value invalid'}
             if p < 0 or p > 1:
                 return {'error': f'Component {idx+1} fixed value must be between 0 and 100'}
-            fixed_sum += p
-            fixed_x_contrib += p * x_i
-            fixed_fractions.append((idx, p))
-        else:
-            # variable component
-            lb = 0.0
-            ub = 1.0
-            if ctype == 'range':
-                # range specified
-                minv = comp.get('min')
-                maxv = comp.get('max')
-                if minv is None or maxv is None:
-                    return {'error': f'Component {idx+1} range requires min and max'}
-                try:
-                    lb = float(minv) / 100.0
-                    ub = float(maxv) / 100.0
-                except (TypeError, ValueError):
-                    return {'error': f'Component {idx+1} range values invalid'}
-                if lb < 0 or ub > 1 or lb > ub:
-                    return {'error': f'Component {idx+1} range is invalid'}
-            # store variable
-            var_indices.append(idx)
-            x_values.append(x_i)
-            var_bounds.append((lb, ub))
-            # check objective flags
-            if ctype == 'objectiveMin':
-                if objective_type is not None:
-                    return {'error': 'Multiple objectives not allowed'}
-                objective_type = 'component'
-                objective_index = len(var_indices) - 1
-                objective_direction = 'min'
-            elif ctype == 'objectiveMax':
-                if objective_type is not None:
-                    return {'error': 'Multiple objectives not allowed'}
-                objective_type = 'component'
-                objective_index = len(var_indices) - 1
-                objective_direction = 'max'
+            values[idx] = p
+            is_fixed[idx] = True
+            continue
+        # variable component
+        if ctype == 'range':
+            # range specified
+            minv = comp.get('min')
+            maxv = comp.get('max')
+            if minv is None or maxv is None:
+                return {'error': f'Component {idx+1} range requires min and max'}
+            try:
+                lb = float(minv) / 100.0
+                ub = float(maxv) / 100.0
+            except (TypeError, ValueError):
+                return {'error': f'Component {idx+1} range values invalid'}
+            if lb < 0 or ub > 1 or lb > ub:
+                return {'error': f'Component {idx+1} range is invalid'}
+            mins[idx] = lb
+            maxs[idx] = ub
+        # check objective flags
+        if ctype == 'objectiveMin' or ctype == 'objectiveMax':
+            if objective_type is not None:
+                return {'error': 'Multiple objectives not allowed'}
+            objective_type = 'component'
+            objective_index = n_var
+            objective_direction = 'min' if ctype == 'objectiveMin' else 'max'
+        n_var += 1
+    fixed_indices = np.flatnonzero(is_fixed)
+    var_indices = np.flatnonzero(~is_fixed)  # original index of each variable
+    m = len(var_indices)
+    # total fraction and x contribution of the fixed components, and the x
+    # values of the variable ones (Walther-transformed in a scratch buffer)
+    fixed = _fixed_summary(tuple(zip(viscs[is_fixed].tolist(), values[is_fixed].tolist())))
+    scratch = _scratch
+    if scratch.m != m:
+        scratch.resize(m)
+    xv = scratch.x_values
+    np.take(viscs, var_indices, out=xv)
+    xv = _walther_x_array(xv, out=xv)
+    if fixed is None or xv is None:
+        return {'error': 'Viscosities are too low for the Walther transform'}
+    fixed_sum, fixed_x_contrib = fixed
     # after processing components, handle mixture objective
     mtype = mix_info.get('type', 'free')
     if mtype == 'objectiveMin' or mtype == 'objectiveMax':
@@ -482,97 +816,110 @@ def solve_general_mixture(data):
             return {'error': 'Sum of fixed components must be exactly 100%'}
         # compute mixture viscosity
         x_total = fixed_x_contrib
-        v_mix = 10 ** (10 ** x_total) - 0.7
+        v_mix = _inv_walther(x_total)
         # check mixture constraints
         if mix_set_val is not None and abs(v_mix - mix_set_val) > 1e-6:
             return {'error': 'Mixture viscosity does not match target value'}
         if mix_range_min is not None and (v_mix < mix_range_min - 1e-6 or v_mix > mix_range_max + 1e-6):
             return {'error': 'Mixture viscosity not within specified range'}
+        fixed_fractions = zip(fixed_indices.tolist(), values[fixed_indices].tolist())
         return {'fractions': {idx: frac * 100.0 for idx, frac in fixed_fractions}, 'viscosity': v_mix}
-    # build linear programming problem
-    m = len(var_indices)
+    # build linear programming problem in per-thread scratch buffers
+    n_eq = 1 if mix_set_val is None else 2
+    n_ub = 0
+    if mix_set_val is None:
+        n_ub = (mix_range_min is not None) + (mix_range_max is not None)
+    A_eq = scratch.A_eq[n_eq]
+    b_eq = scratch.b_eq[n_eq]
+    A_ub = scratch.A_ub[n_ub]
+    b_ub = scratch.b_ub[n_ub]
     # Equality: sum p_i = 1 - fixed_sum
-    A_eq = np.ones((1, m))
-    b_eq = np.array([1.0 - fixed_sum])
-    # Mixture equality if setValue specified
-    A_ub = []
-    b_ub = []
-    A_eq2 = []
-    b_eq2 = []
+    A_eq[0].fill(1.0)
+    b_eq[0] = 1.0 - fixed_sum
     if mix_set_val is not None:
-        # equality constraint: sum p_i * x_i = x_target - fixed_x_contrib
-        x_target = math.log10(math.log10(mix_set_val + 0.7))
-        row = np.array(x_values)
-        A_eq2.append(row)
-        b_eq2.append(x_target - fixed_x_contrib)
+        # Mixture equality: sum p_i * x_i = x_target - fixed_x_contrib
+        x_target = _walther_x(mix_set_val)
+        A_eq[1] = xv
+        b_eq[1] = x_target - fixed_x_contrib
     else:
         # range constraints if any
+        row = 0
         if mix_range_min is not None:
-            x_min = math.log10(math.log10(mix_range_min + 0.7))
+            x_min = _walther_x(mix_range_min)
             # x_total >= x_min => -(x_total) <= -(x_min)
-            row = -np.array(x_values)
-            A_ub.append(row)
-            b_ub.append(-(x_min - fixed_x_contrib))
+            np.negative(xv, out=A_ub[row])
+            b_ub[row] = -(x_min - fixed_x_contrib)
+            row += 1
         if mix_range_max is not None:
-            x_max = math.log10(math.log10(mix_range_max + 0.7))
-            row = np.array(x_values)
-            A_ub.append(row)
-            b_ub.append(x_max - fixed_x_contrib)
-    # combine equality matrices
-    if A_eq2:
-        A_eq = np.vstack([A_eq, A_eq2])
-        b_eq = np.concatenate([b_eq, b_eq2])
+            x_max = _walther_x(mix_range_max)
+            A_ub[row] = xv
+            b_ub[row] = x_max - fixed_x_contrib
     # objective vector
-    c = np.zeros(m)
+    c = scratch.c
+    c.fill(0.0)
     if objective_type == 'mixture':
         # objective to minimise or maximise mixture viscosity (i.e., x_total)
-        # minimise mixture viscosity -> minimise x_total -> objective = x_values
+        # minimise mixture viscosity -> minimise x_total -> objective = xv
         # maximise mixture viscosity -> maximise x_total -> minimise -x_total
         if objective_direction == 'min':
-            c = np.array(x_values)
+            c[:] = xv
         else:
-            c = -np.array(x_values)
+            np.negative(xv, out=c)
     elif objective_type == 'component':
         # objective to minimise or maximise a specific component fraction
-        idx = objective_index
-        c = np.zeros(m)
         if objective_direction == 'min':
-            c[idx] = 1.0
+            c[objective_index] = 1.0
         else:
-            c[idx] = -1.0
-    else:
-        # no objective; just find any feasible solution; objective is zero
-        c = np.zeros(m)
-    # convert A_ub and b_ub lists to arrays if not empty
-    if A_ub:
-        A_ub = np.array(A_ub)
-        b_ub = np.array(b_ub)
-    else:
-        A_ub = None
-        b_ub = None
-    # solve linear program
-    res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq, bounds=var_bounds, method='highs')
-    if not res.success:
-        return {'error': 'No feasible solution found'}
+            c[objective_index] = -1.0
+    # otherwise no objective; just find any feasible solution with c = 0
+    lb = scratch.lb
+    ub = scratch.ub
+    np.take(mins, var_indices, out=lb)
+    np.take(maxs, var_indices, out=ub)
+    # with as many independent equalities as variables the feasible set is at
+    # most one point, whatever the objective: solve the system directly
+    x_opt = None
+    if A_eq.shape[0] == m:
+        try:
+            x_opt = np.linalg.solve(A_eq, b_eq)
+        except np.linalg.LinAlgError:
+            pass  # singular system, leave it to the LP
+        if x_opt is not None:
+            if ((x_opt < lb - 1e-9).any() or (x_opt > ub + 1e-9).any()
+                    or (A_ub @ x_opt > b_ub + 1e-9).any()):
+                return {'error': 'No feasible solution found'}
+            x_opt = np.clip(x_opt, lb, ub)
+    if x_opt is None:
+        # solve linear program with the compiled simplex first
+        x_opt, status = _simplex_solve(c, A_eq, b_eq, A_ub, b_ub, lb, ub)
+        if status != 0:
+            # the small solver could not certify an optimum; let HiGHS decide.
+            # HiGHS works on column-compressed matrices, so hand them over as
+            # CSC rather than letting linprog convert the dense arrays
+            has_ub = len(b_ub) > 0
+            res = linprog(c, A_ub=csc_matrix(A_ub) if has_ub else None,
+                          b_ub=b_ub if has_ub else None,
+                          A_eq=csc_matrix(A_eq), b_eq=b_eq, bounds=np.column_stack([lb, ub]),
+                          method='highs', options=_LP_OPTIONS)
+            if not res.success:
+                return {'error': 'No feasible solution found'}
+            x_opt = res.x
     # assemble fractions back into original order
-    fractions = [0.0 for _ in range(n)]
-    for (fixed_idx, frac) in fixed_fractions:
-        fractions[fixed_idx] = frac
-    for j, orig_idx in enumerate(var_indices):
-        fractions[orig_idx] = res.x[j]
+    fractions = values.copy()
+    fractions[var_indices] = x_opt
     # verify non‑negativity and sum
-    if any(f < -1e-6 for f in fractions):
+    if (fractions < -1e-6).any():
         return {'error': 'Solution contains negative fractions'}
-    total_sum = sum(fractions)
+    total_sum = fractions.sum()
     if abs(total_sum - 1.0) > 1e-6:
         # due to numerical error, normalise
-        fractions = [f / total_sum for f in fractions]
+        fractions /= total_sum
     # compute mixture viscosity
-    x_total = fixed_x_contrib + sum(res.x[j] * x_values[j] for j in range(m))
-    viscosity = 10 ** (10 ** x_total) - 0.7
+    x_total = fixed_x_contrib + float(x_opt @ xv)
+    viscosity = _inv_walther(x_total)
     # return fractions in percent along with viscosity
     return {
-        'fractions': {i: round(f * 100.0, 6) for i, f in enumerate(fractions)},
+        'fractions': {i: round(f * 100.0, 6) for i, f in enumerate(fractions.tolist())},
         'viscosity': viscosity
     }
 
@@ -263,16 +263,17 @@ document.addEventListener('DOMContentLoaded', () => {
           // update table
           tempTableBody.innerHTML = '';
           currentChartData = [];
-          body.table.forEach(row => {
+          body.temps.forEach((temp, i) => {
+            const visc = body.viscs[i];
             const tr = document.createElement('tr');
             const tdT = document.createElement('td');
-            tdT.textContent = row.temperature;
+            tdT.textContent = temp;
             const tdV = document.createElement('td');
-            tdV.textContent = row.viscosity.toFixed(3);
+            tdV.textContent = visc.toFixed(3);
             tr.appendChild(tdT);
             tr.appendChild(tdV);
             tempTableBody.appendChild(tr);
-            currentChartData.push({ x: row.temperature, y: row.viscosity });
+            currentChartData.push({ x: temp, y: visc });
           });
           drawChart(currentChartData);
         }